@@ -1,30 +1,55 @@
 """Generic data access object pattern for SQLAlchemy models.
 
 Provides an abstract base class with pooled session management, standard CRUD operations,
-and optional fire-and-forget execution. Subclasses must implement the :py:attr:`model` property
+native asyncio counterparts, and optional fire-and-forget execution. Subclasses must set the :py:attr:`model` class attribute
 to specify their target SQLAlchemy ORM model.
 """
 
 from __future__ import annotations
 
 import asyncio
-import os
+import atexit
+import logging
+import queue
 import threading
-from abc import ABC, abstractmethod
+import time
+from abc import ABC
 from concurrent.futures import Future, ThreadPoolExecutor
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
 from typing import (
     Any,
+    AsyncIterator,
+    Awaitable,
     Callable,
     ClassVar,
     Generic,
     Iterator,
     List,
     Optional,
+    Sequence,
     TypeVar,
+    cast,
 )
 
+from sqlalchemy import (
+    any_,
+    bindparam,
+    column,
+    delete,
+    insert,
+    inspect,
+    literal,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import CursorResult
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import QueuePool
 
 from psql_connection import PostgresConnection
 from utils.logger import Logger # Use you logger this is only a placeholder.
@@ -36,15 +61,26 @@ IdT = TypeVar("IdT")
 #: Type variable for synchronous operation results.
 SyncResultT = TypeVar("SyncResultT")
 
+#: Per-request read cache (model class -> read key -> result); ``None`` outside a scope.
+_request_cache: ContextVar[dict[Any, dict[Any, Any]] | None] = ContextVar(
+    "dao_request_cache", default=None
+)
+
+#: Queued fire-and-forget write: ``(dao, operation, payload, future)``. A ``None`` dao
+#: marks a flush point whose future resolves once every earlier write is flushed.
+_BatchedOp = tuple[Optional["DataAccessObject[Any, Any]"], str, Any, "Future[Any]"]
+
 
 class DataAccessObject(Generic[ModelT, IdT], ABC):
     """Provide managed CRUD operations for a SQLAlchemy model.
 
     Generic abstract base class encapsulating session lifecycle, connection pooling,
     and common database operations. Subclasses specify a target ORM model via the
-    :py:attr:`model` property and inherit synchronous CRUD methods (:py:meth:`get`,
-    :py:meth:`create`, :py:meth:`update`, etc.) plus optional fire-and-forget variants
-    (``*_ff``) that return :py:class:`concurrent.futures.Future` instances.
+    :py:attr:`model` class attribute and inherit synchronous CRUD methods (:py:meth:`get`,
+    :py:meth:`create`, :py:meth:`update`, etc.), native coroutine counterparts
+    (:py:meth:`aget`, :py:meth:`acreate`, ...) backed by an asyncio engine, plus optional
+    fire-and-forget variants (``*_ff``) that return :py:class:`concurrent.futures.Future`
+    instances.
 
     All synchronous operations automatically manage sessions and expunge results
     to ensure detached instances.
@@ -52,8 +88,6 @@ class DataAccessObject(Generic[ModelT, IdT], ABC):
     Attributes:
         _pg: Connection pool manager for this DAO instance.
         _logger: Logger instance named after the subclass.
-        _bg_executor: Shared thread pool for fire-and-forget operations (lazily initialized).
-        _bg_lock: Lock protecting executor initialization.
 
     See Also:
         :py:class:`database.psql_connection.PostgresConnection`
@@ -72,7 +106,14 @@ class DataAccessObject(Generic[ModelT, IdT], ABC):
             database_name: Target PostgreSQL database name; defaults to empty string.
             min_connections: Minimum pool size.
             max_connections: Maximum pool size.
+
+        Raises:
+            TypeError: If the subclass does not define :py:attr:`model`.
         """
+        if not hasattr(self, "_model_cls"):
+            raise TypeError(
+                f"{type(self).__name__} must define a 'model' class attribute"
+            )
         self._pg = PostgresConnection(
             database_name=database_name or "",
             min_connections=min_connections,
@@ -80,22 +121,40 @@ class DataAccessObject(Generic[ModelT, IdT], ABC):
         )
         self._logger: Logger = Logger(name=self.__class__.__name__)
 
-    #: Shared thread pool for fire-and-forget operations, lazily initialized.
-    _bg_executor: ClassVar[ThreadPoolExecutor | None] = None
-    #: Lock protecting executor initialization.
-    _bg_lock: ClassVar[threading.Lock] = threading.Lock()
-
-    @property
-    @abstractmethod
-    def model(self) -> type[ModelT]:
-        """Return the SQLAlchemy ORM model class managed by this DAO.
-
-        Subclasses must implement this property to specify the target model.
-
-        Returns:
-            The SQLAlchemy declarative model class.
-        """
-        raise NotImplementedError
+    #: SQLAlchemy ORM model class managed by this DAO; subclasses must set it.
+    model: ClassVar[type[Any]]
+    #: Maximum number of queued fire-and-forget writes coalesced into one flush.
+    _batch_max_size: ClassVar[int] = 256
+    #: Seconds the batch worker keeps collecting writes after the first one arrives.
+    _batch_max_delay: ClassVar[float] = 0.005
+    #: Maximum number of fire-and-forget writes waiting for the batch worker.
+    _batch_queue_limit: ClassVar[int] = 4096
+    #: Model class resolved from :py:attr:`model` by :py:meth:`__init_subclass__`.
+    _model_cls: ClassVar[type[Any]]
+    #: Primary key attribute name resolved by :py:meth:`__init_subclass__`.
+    _pk_name: ClassVar[str]
+    #: Primary key column expression resolved by :py:meth:`__init_subclass__`.
+    _pk_col: ClassVar[Any]
+    #: Prebuilt ``SELECT ... WHERE pk = :id`` for this subclass's model.
+    _select_by_pk: ClassVar[Any]
+    #: Prebuilt ``DELETE ... WHERE pk = :id`` for this subclass's model.
+    _delete_by_pk: ClassVar[Any]
+    #: Prebuilt ``SELECT 1 ... WHERE pk = :id`` for this subclass's model.
+    _exists_by_pk: ClassVar[Any]
+    #: Prebuilt ``SELECT ... WHERE pk = ANY(:ids)`` for this subclass's model.
+    _select_by_pks: ClassVar[Any]
+    #: Background executor and in-flight semaphore per shared engine, created on first use.
+    _bg_pools: ClassVar[
+        dict[tuple[str, str], tuple[ThreadPoolExecutor, threading.BoundedSemaphore]]
+    ] = {}
+    #: Guards creation of :py:attr:`_bg_pools` entries.
+    _bg_pools_lock: ClassVar[threading.Lock] = threading.Lock()
+    #: Fire-and-forget write queue per shared engine, each drained by one batch worker.
+    _batch_queues: ClassVar[dict[tuple[str, str], queue.Queue[_BatchedOp]]] = {}
+    #: Guards creation of :py:attr:`_batch_queues` entries and their workers.
+    _batch_queues_lock: ClassVar[threading.Lock] = threading.Lock()
+    #: Whether the missing-``asyncpg`` thread fallback has already been logged.
+    _async_fallback_logged: ClassVar[bool] = False
 
     @property
     def primary_key_attribute_name(self) -> str:
@@ -114,7 +173,44 @@ class DataAccessObject(Generic[ModelT, IdT], ABC):
         Returns:
             The SQLAlchemy column object for the primary key.
         """
-        return getattr(self.model, self.primary_key_attribute_name)
+        return self._pk_col
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Resolve the model, primary key column and pk statements once per subclass.
+
+        :py:attr:`model` is normally a plain class attribute (``model = User``). A
+        ``model`` property is still accepted and, like a
+        :py:attr:`primary_key_attribute_name` property, is evaluated against the class
+        itself, so it must not depend on instance state. Intermediate subclasses that
+        do not set :py:attr:`model` yet are skipped.
+        """
+        super().__init_subclass__(**kwargs)
+        model_attr = getattr(cls, "model", None)
+        if model_attr is None or getattr(model_attr, "__isabstractmethod__", False):
+            return
+        # Read through the class a property is the descriptor itself; __get__ calls
+        # its getter with the class standing in for the instance
+        pk_attr: Any = cls.primary_key_attribute_name
+        cls._model_cls = (
+            model_attr.__get__(cls) if isinstance(model_attr, property) else model_attr
+        )
+        cls._pk_name = (
+            pk_attr.__get__(cls) if isinstance(pk_attr, property) else pk_attr
+        )
+        # Store the column expression: the instrumented attribute is a descriptor and
+        # would try to bind to DAO instances when read back through ``self``.
+        cls._pk_col = getattr(cls._model_cls, cls._pk_name).expression
+        cls._select_by_pk = select(cls._model_cls).where(cls._pk_col == bindparam("id"))
+        cls._exists_by_pk = select(literal(1)).where(cls._pk_col == bindparam("id"))
+        # A single array parameter keeps the SQL text identical for any number of ids
+        cls._select_by_pks = select(cls._model_cls).where(
+            cls._pk_col == any_(bindparam("ids", type_=ARRAY(cls._pk_col.type)))
+        )
+        cls._delete_by_pk = (
+            delete(cls._model_cls)
+            .where(cls._pk_col == bindparam("id"))
+            .execution_options(synchronize_session=False)
+        )
 
     @contextmanager
     def session_scope(self) -> Iterator[Session]:
@@ -127,11 +223,28 @@ class DataAccessObject(Generic[ModelT, IdT], ABC):
 
         Examples:
             >>> with dao.session_scope() as session:
-            ...     result = session.query(Model).all()
+            ...     result = session.scalars(select(Model)).all()
         """
         with self._pg.get_session() as session:
             yield session
 
+    @asynccontextmanager
+    async def async_session_scope(self) -> AsyncIterator[AsyncSession]:
+        """Provide a managed SQLAlchemy asyncio session context.
+
+        Yields a session from this DAO's asyncio connection pool (``asyncpg`` driver)
+        and ensures proper cleanup.
+
+        Yields:
+            A :py:class:`sqlalchemy.ext.asyncio.AsyncSession` instance.
+
+        Examples:
+            >>> async with dao.async_session_scope() as session:
+            ...     result = (await session.execute(select(Model))).scalars().all()
+        """
+        async with self._pg.get_async_session() as session:
+            yield session
+
     def _run_in_session(self, fn: Callable[[Session], SyncResultT]) -> SyncResultT:
         """Execute a callable within a managed session.
 
@@ -147,39 +260,187 @@ class DataAccessObject(Generic[ModelT, IdT], ABC):
     async def _run_in_session_async(
         self, fn: Callable[[Session], SyncResultT]
     ) -> SyncResultT:
-        """Execute a synchronous callable in a background thread and await its result.
+        """Execute a session callable on the asyncio engine and await its result.
+
+        The callable runs through :py:meth:`AsyncSession.run_sync`, so the same
+        ``Session``-based operations back both the sync and async APIs without a
+        thread hop. When the ``asyncpg`` driver is not installed, falls back to
+        running :py:meth:`_run_in_session` on the engine's background executor
+        rather than the event loop's shared default executor; this is logged once
+        per process.
 
         Args:
             fn: Callable receiving a :py:class:`~sqlalchemy.orm.Session` and returning a result.
 
         Returns:
-            The result of invoking ``fn`` in a worker thread.
+            The result of invoking ``fn``.
+        """
+        if not self._pg.async_driver_available():
+            if not DataAccessObject._async_fallback_logged:
+                DataAccessObject._async_fallback_logged = True
+                self._logger.warning(
+                    "asyncpg is not installed; async DAO calls run on background threads",
+                    logger_name=self.__class__.__name__,
+                )
+            loop = asyncio.get_running_loop()
+            executor, _ = self._get_bg_pool()
+            return await loop.run_in_executor(executor, self._run_in_session, fn)
+        async with self.async_session_scope() as session:
+            return await session.run_sync(fn)
+
+    async def _write_in_session_async(
+        self, fn: Callable[[Session], SyncResultT]
+    ) -> SyncResultT:
+        """Run a write through :py:meth:`_run_in_session_async`, invalidating the cache.
+
+        Cached reads for the model are dropped both before and after the awaited
+        write, since another task in the same request scope may read and cache the
+        old row while the write is in flight.
+        """
+        self._invalidate_request_cache()
+        try:
+            return await self._run_in_session_async(fn)
+        finally:
+            self._invalidate_request_cache()
+
+    # ---- Per-request read cache ------------------------------------------------
+    @staticmethod
+    @contextmanager
+    def request_cache_scope() -> Iterator[None]:
+        """Memoize :py:meth:`get`, :py:meth:`exists` and :py:meth:`list_by` for a block.
+
+        Within the scope, repeated reads with the same arguments are served from a
+        context-local cache instead of the database. Any write through a DAO drops the
+        cached reads for that DAO's model. Nested scopes share the outermost cache.
+
+        Note:
+            Cached instances are shared between callers inside the scope; treat them
+            as read-only or re-fetch outside the scope before mutating.
+
+        Examples:
+            >>> with DataAccessObject.request_cache_scope():
+            ...     user = dao.get(42)
+            ...     same_user = dao.get(42)  # no second query
+        """
+        if _request_cache.get() is not None:
+            yield
+            return
+        token = _request_cache.set({})
+        try:
+            yield
+        finally:
+            _request_cache.reset(token)
+
+    def _cached_read(
+        self, key: tuple[Any, ...], load: Callable[[], SyncResultT]
+    ) -> SyncResultT:
+        """Return the cached result for ``key`` or call ``load`` and cache it."""
+        cache = _request_cache.get()
+        if cache is None:
+            return load()
+        entries = cache.setdefault(self._model_cls, {})
+        try:
+            if key in entries:
+                return entries[key]
+        except TypeError:  # unhashable filter value; skip caching
+            return load()
+        result = entries[key] = load()
+        return result
+
+    async def _cached_read_async(
+        self, key: tuple[Any, ...], load: Callable[[], Awaitable[SyncResultT]]
+    ) -> SyncResultT:
+        """Async counterpart of :py:meth:`_cached_read`."""
+        cache = _request_cache.get()
+        if cache is None:
+            return await load()
+        entries = cache.setdefault(self._model_cls, {})
+        try:
+            if key in entries:
+                return entries[key]
+        except TypeError:  # unhashable filter value; skip caching
+            return await load()
+        result = entries[key] = await load()
+        return result
+
+    def _invalidate_request_cache(self) -> None:
+        """Drop cached reads for this DAO's model in the current request scope."""
+        cache = _request_cache.get()
+        if cache is not None:
+            cache.pop(self._model_cls, None)
+
+    def _invalidate_request_cache_on_done(
+        self, future: Future[SyncResultT]
+    ) -> Future[SyncResultT]:
+        """Drop this model's cached reads now and again once ``future`` completes.
+
+        A fire-and-forget write lands after it is submitted, so reads cached in the
+        meantime would be stale. The scope's cache is captured here because the
+        done-callback runs on a worker thread outside the caller's context.
         """
-        return await asyncio.to_thread(self._run_in_session, fn)
+        cache = _request_cache.get()
+        if cache is not None:
+            model_cls = self._model_cls
+            cache.pop(model_cls, None)
+            future.add_done_callback(lambda _: cache.pop(model_cls, None))
+        return future
 
     # ---- Background execution helpers ---------------------------------------
-    @classmethod
-    def _get_bg_executor(cls) -> ThreadPoolExecutor:
-        """Retrieve or lazily initialize the shared background thread pool.
+    def _get_bg_pool(self) -> tuple[ThreadPoolExecutor, threading.BoundedSemaphore]:
+        """Retrieve or lazily initialize the background thread pool for this engine.
+
+        DAOs on the same database and user share one connection pool, so they also
+        share one executor and one in-flight semaphore, both sized from that
+        connection pool so workers never queue on a DB checkout. Repeat calls are a
+        single dict lookup; only the first call takes the lock, so concurrent first
+        submits still create just one executor.
 
         Returns:
-            Shared :py:class:`~concurrent.futures.ThreadPoolExecutor` instance.
-        """
-        if cls._bg_executor is None:
-            with cls._bg_lock:
-                if cls._bg_executor is None:
-                    max_workers = max(4, (os.cpu_count() or 1))
-                    cls._bg_executor = ThreadPoolExecutor(
-                        max_workers=max_workers, thread_name_prefix="dao-bg"
+            The shared :py:class:`~concurrent.futures.ThreadPoolExecutor` and the
+            semaphore capping its in-flight tasks.
+        """
+        key = self._pg._engine_key
+        bg_pool = self._bg_pools.get(key)
+        if bg_pool is None:
+            with self._bg_pools_lock:
+                bg_pool = self._bg_pools.get(key)
+                if bg_pool is None:
+                    # The engine is always built with a QueuePool
+                    size = cast(QueuePool, self._pg.get_engine().pool).size()
+                    bg_pool = self._bg_pools[key] = (
+                        ThreadPoolExecutor(
+                            max_workers=size, thread_name_prefix="dao-bg"
+                        ),
+                        threading.BoundedSemaphore(size),
                     )
-        return cls._bg_executor
+        return bg_pool
+
+    def _log_error(self, message: str, exc: BaseException) -> None:
+        """Report a failure through the DAO logger when ERROR logging is enabled.
+
+        Skipping the call for disabled levels avoids stringifying the exception on
+        hot failure paths shared by many worker threads. Loggers that do not provide
+        ``isEnabledFor`` (the project logger is a placeholder) are always called.
+
+        Args:
+            message: Human-readable description of the failed operation.
+            exc: The exception being reported.
+        """
+        is_enabled_for = getattr(self._logger, "isEnabledFor", None)
+        if is_enabled_for is None or is_enabled_for(logging.ERROR):
+            self._logger.error(
+                message, exception=exc, logger_name=self.__class__.__name__
+            )
 
     def _submit_background(
         self, fn: Callable[[Session], SyncResultT]
     ) -> Future[SyncResultT]:
         """Submit a callable to run in the background thread pool.
 
-        Wraps the callable with session management and error logging.
+        Wraps the callable with session management and error logging. At most one
+        task per pooled connection is in flight across all DAOs sharing the engine;
+        further submissions block until one finishes, giving callers backpressure
+        instead of an unbounded queue.
 
         Args:
             fn: Callable receiving a :py:class:`~sqlalchemy.orm.Session` and returning a result.
@@ -192,15 +453,383 @@ class DataAccessObject(Generic[ModelT, IdT], ABC):
             try:
                 return self._run_in_session(fn)
             except Exception as e:  # pragma: no cover - defensive logging
-                print(str(e))
-                self._logger.error(
-                    "Background DAO operation failed",
-                    exception=e,
-                    logger_name=self.__class__.__name__,
-                )
+                self._log_error("Background DAO operation failed", e)
                 raise
 
-        return self._get_bg_executor().submit(_runner)
+        executor, slots = self._get_bg_pool()
+        slots.acquire()
+        try:
+            future = executor.submit(_runner)
+        except BaseException:
+            slots.release()
+            raise
+        future.add_done_callback(lambda _: slots.release())
+        return future
+
+    def _submit_batched(self, operation: str, payload: Any) -> Future[Any]:
+        """Queue a write for the batch worker and return its pending future.
+
+        Args:
+            operation: One of ``"create"``, ``"update"`` or ``"delete"``.
+            payload: Fields dict, ``(id_value, fields)`` tuple or primary key value,
+                respectively.
+
+        Returns:
+            A :py:class:`~concurrent.futures.Future` resolved once the batch is flushed.
+            Blocks while :py:attr:`_batch_queue_limit` writes are already waiting.
+
+        Note:
+            All DAOs sharing an engine share one queue and one daemon worker thread,
+            so the worker never blocks interpreter shutdown; an :py:mod:`atexit` hook
+            flushes writes still queued at exit instead.
+        """
+        future: Future[Any] = Future()
+        self._get_batch_queue().put((self, operation, payload, future))
+        return future
+
+    def _get_batch_queue(self) -> queue.Queue[_BatchedOp]:
+        """Retrieve or lazily create this engine's write queue and its batch worker."""
+        key = self._pg._engine_key
+        pending = self._batch_queues.get(key)
+        if pending is None:
+            with self._batch_queues_lock:
+                pending = self._batch_queues.get(key)
+                if pending is None:
+                    pending = queue.Queue(maxsize=self._batch_queue_limit)
+                    threading.Thread(
+                        target=self._batch_worker_loop,
+                        args=(pending,),
+                        name=f"dao-batch-{key[0]}",
+                        daemon=True,
+                    ).start()
+                    atexit.register(self._wait_for_batch_queue, pending)
+                    self._batch_queues[key] = pending
+        return pending
+
+    @staticmethod
+    def _batch_worker_loop(pending: queue.Queue[_BatchedOp]) -> None:
+        """Drain the write queue forever, coalescing bursts into batched statements.
+
+        After the first queued write arrives, keeps collecting for up to
+        :py:attr:`_batch_max_delay` seconds or :py:attr:`_batch_max_size` writes (as
+        set on that write's DAO), then flushes them together. A flush that raises
+        fails its own unresolved futures and leaves the worker running.
+        """
+        while True:
+            first = pending.get()
+            limits = first[0] if first[0] is not None else DataAccessObject
+            ops = [first]
+            deadline = time.monotonic() + limits._batch_max_delay
+            while len(ops) < limits._batch_max_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    ops.append(pending.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            try:
+                DataAccessObject._flush_batch(ops)
+            except Exception as e:
+                for *_, future in ops:
+                    if not future.done():
+                        future.set_exception(e)
+            # Don't keep the last batch's DAOs alive while waiting for the next one
+            del first, limits, ops
+
+    @staticmethod
+    def _wait_for_batch_queue(pending: queue.Queue[_BatchedOp]) -> None:
+        """Block until every write queued on ``pending`` so far has been flushed."""
+        flushed: Future[Any] = Future()
+        pending.put((None, "flush", None, flushed))
+        flushed.result()
+
+    @staticmethod
+    def _flush_batch(ops: List[_BatchedOp]) -> None:
+        """Run one batched statement per run of consecutive writes of the same operation.
+
+        Only adjacent writes from the same DAO class are grouped, so a mixed sequence
+        such as create, delete, create is applied in the order it was queued.
+        """
+        runs: List[tuple[Any, str, List[tuple[Any, Future[Any]]]]] = []
+        for dao, operation, payload, future in ops:
+            if not future.set_running_or_notify_cancel():
+                continue
+            if (
+                not runs
+                or type(runs[-1][0]) is not type(dao)
+                or runs[-1][1] != operation
+            ):
+                runs.append((dao, operation, []))
+            runs[-1][2].append((payload, future))
+        for dao, operation, entries in runs:
+            if dao is None:  # Flush point: everything queued before it is done
+                for _, future in entries:
+                    future.set_result(None)
+            else:
+                dao._run_batch_group(operation, entries)
+
+    def _run_batch_group(
+        self, operation: str, entries: List[tuple[Any, Future[Any]]]
+    ) -> None:
+        """Execute one operation group and resolve each entry's future.
+
+        If the batched statement fails, the entries are retried one by one so that a
+        single bad row only fails its own future.
+        """
+        if len(entries) > 1:
+            payloads = [payload for payload, _ in entries]
+            try:
+                results = self._run_in_session(
+                    self._batch_write_op(operation, payloads)
+                )
+            except Exception:
+                pass  # Fall back to one session per write below.
+            else:
+                for (_, future), result in zip(entries, results):
+                    future.set_result(result)
+                return
+
+        for payload, future in entries:
+            try:
+                result = self._run_in_session(self._single_write_op(operation, payload))
+            except Exception as e:
+                self._log_error("Background DAO operation failed", e)
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+    def _batch_write_op(
+        self, operation: str, payloads: List[Any]
+    ) -> Callable[[Session], List[Any]]:
+        """Build the batched session callable for a group of queued writes."""
+        if operation == "create":
+            return lambda session: self._bulk_create_in_session(session, payloads)
+        if operation == "update":
+            return lambda session: self._batch_update_in_session(session, payloads)
+        return lambda session: self._batch_delete_in_session(session, payloads)
+
+    def _single_write_op(
+        self, operation: str, payload: Any
+    ) -> Callable[[Session], Any]:
+        """Build the unbatched session callable for one queued write."""
+        if operation == "create":
+            return lambda session: self._create_in_session(session, payload)
+        if operation == "update":
+            id_value, fields = payload
+            return lambda session: self._update_in_session(session, id_value, fields)
+        return lambda session: self._delete_in_session(session, payload)
+
+    # ---- Session operations (shared by sync, async and background APIs) -----
+    def _get_in_session(self, session: Session, id_value: IdT) -> Optional[ModelT]:
+        """Fetch a single model instance by primary key within ``session``.
+
+        Executes the prebuilt ``SELECT ... WHERE pk = :id`` without the identity-map
+        lookup of ``Session.get``. Sessions do not expire on commit, so the row is
+        detached with its loaded state when the session closes and needs no expunge.
+        """
+        return session.scalars(self._select_by_pk, {"id": id_value}).first()
+
+    def _get_many_in_session(
+        self, session: Session, ids: Sequence[IdT]
+    ) -> List[ModelT]:
+        """Fetch the rows for ``ids`` in one ``WHERE pk = ANY(:ids)`` query, in input order."""
+        rows = {
+            getattr(row, self._pk_name): row
+            for row in session.scalars(self._select_by_pks, {"ids": list(ids)})
+        }
+        return [rows[id_value] for id_value in ids if id_value in rows]
+
+    def _list_in_session(
+        self,
+        session: Session,
+        *,
+        limit: int,
+        offset: int,
+        filters: dict[str, Any],
+        order_by: Any = None,
+    ) -> List[ModelT]:
+        """Retrieve a filtered, optionally sorted, paginated list within ``session``."""
+        stmt = select(self._model_cls).filter_by(**filters)
+        if order_by is not None:
+            stmt = stmt.order_by(order_by)
+        if offset > 0:
+            stmt = stmt.offset(offset)
+        if limit > 0:
+            stmt = stmt.limit(limit)
+        rows = list(session.scalars(stmt).all())
+        # The session holds nothing but these rows; detach them in one call
+        session.expunge_all()
+        return rows
+
+    def _exists_in_session(self, session: Session, id_value: IdT) -> bool:
+        """Check for a row by primary key within ``session`` via ``SELECT 1``."""
+        return session.scalar(self._exists_by_pk, {"id": id_value}) is not None
+
+    def _create_in_session(self, session: Session, fields: dict[str, Any]) -> ModelT:
+        """Insert a new row within ``session`` and return the detached instance.
+
+        Uses ``INSERT ... RETURNING`` so server-generated values come back with the
+        insert itself instead of a follow-up ``SELECT``.
+        """
+        stmt = insert(self._model_cls).values(**fields).returning(self._model_cls)
+        row = session.execute(stmt).scalar_one()
+        session.expunge(row)
+        return row
+
+    def _update_in_session(
+        self, session: Session, id_value: IdT, fields: dict[str, Any]
+    ) -> Optional[ModelT]:
+        """Update a row by primary key within ``session``; ``None`` if not found.
+
+        Uses a single ``UPDATE ... WHERE pk = :id RETURNING`` statement.
+        """
+        if not fields:
+            return self._get_in_session(session, id_value)
+        stmt = (
+            update(self._model_cls)
+            .where(self._pk_col == id_value)
+            .values(**fields)
+            .returning(self._model_cls)
+            .execution_options(synchronize_session=False)
+        )
+        row = session.execute(stmt).scalar_one_or_none()
+        if row is not None:
+            session.expunge(row)
+        return row
+
+    def _upsert_in_session(
+        self, session: Session, id_value: IdT, fields: dict[str, Any]
+    ) -> ModelT:
+        """Insert or update a row by primary key within ``session``.
+
+        Issues one PostgreSQL ``INSERT ... ON CONFLICT (pk) DO UPDATE ... RETURNING``.
+        A primary key also given in ``fields`` takes precedence over ``id_value`` for
+        the inserted row.
+        """
+        row_data = {self._pk_name: id_value, **fields}
+        if not fields:
+            # Nothing to update on conflict: keep an existing row as-is.
+            existing_row = self._get_in_session(session, id_value)
+            if existing_row is not None:
+                return existing_row
+            return self._create_in_session(session, row_data)
+
+        columns = inspect(self._model_cls).columns
+        insert_stmt = pg_insert(self._model_cls).values(**row_data)
+        # Reuse the proposed row via EXCLUDED so each value is bound only once;
+        # EXCLUDED is keyed by column name, ``fields`` by mapped attribute name
+        upsert_stmt = insert_stmt.on_conflict_do_update(
+            index_elements=[self._pk_col],
+            set_={
+                columns[name]: insert_stmt.excluded[columns[name].name]
+                for name in fields
+            },
+        ).returning(self._model_cls)
+        row = session.execute(upsert_stmt).scalar_one()
+        session.expunge(row)
+        return row
+
+    def _bulk_create_in_session(
+        self, session: Session, rows: List[dict[str, Any]]
+    ) -> List[ModelT]:
+        """Insert many rows within ``session`` and return the detached instances.
+
+        SQLAlchemy's "insertmanyvalues" mode batches the parameter sets into
+        multi-row ``INSERT ... VALUES ... RETURNING`` pages, so N rows cost a
+        handful of round-trips rather than N.
+        """
+        if not rows:
+            return []
+        stmt = insert(self._model_cls).returning(
+            self._model_cls, sort_by_parameter_order=True
+        )
+        created = list(session.scalars(stmt, rows).all())
+        session.expunge_all()
+        return created
+
+    def _bulk_update_in_session(
+        self, session: Session, rows: List[dict[str, Any]]
+    ) -> None:
+        """Update many rows by primary key within ``session`` as one executemany."""
+        if not rows:
+            return
+        session.execute(update(self._model_cls), rows)
+
+    def _batch_update_in_session(
+        self, session: Session, entries: List[tuple[IdT, dict[str, Any]]]
+    ) -> List[Optional[ModelT]]:
+        """Apply many primary-key updates within ``session``.
+
+        Updates to the same row are merged in order, then rows sharing a column set
+        are sent as one ``UPDATE ... FROM (VALUES ...) AS v WHERE pk = v.pk RETURNING``.
+
+        Returns:
+            The detached updated instance (or ``None`` if not found) for each entry.
+        """
+        pk_name = self._pk_name
+        pk_col = self._pk_col
+        columns = inspect(self._model_cls).columns
+        merged: dict[Any, dict[str, Any]] = {}
+        for id_value, fields in entries:
+            merged.setdefault(id_value, {}).update(fields)
+        by_names: dict[tuple[str, ...], List[Any]] = {}
+        for id_value, fields in merged.items():
+            by_names.setdefault(tuple(sorted(fields)), []).append(id_value)
+
+        rows: dict[Any, ModelT] = {}
+        for names, ids in by_names.items():
+            if not names:
+                stmt: Any = select(self._model_cls).where(pk_col.in_(ids))
+            else:
+                data = values(
+                    *(column(name, columns[name].type) for name in (pk_name, *names)),
+                    name="v",
+                ).data(
+                    [
+                        (id_value, *(merged[id_value][n] for n in names))
+                        for id_value in ids
+                    ]
+                )
+                stmt = (
+                    update(self._model_cls)
+                    .where(pk_col == data.c[pk_name])
+                    .values({name: data.c[name] for name in names})
+                    .returning(self._model_cls)
+                    .execution_options(synchronize_session=False)
+                )
+            for row in session.scalars(stmt):
+                rows[getattr(row, pk_name)] = row
+        session.expunge_all()
+        return [rows.get(id_value) for id_value, _ in entries]
+
+    def _batch_delete_in_session(self, session: Session, ids: List[IdT]) -> List[bool]:
+        """Delete many rows by primary key within ``session`` in one statement.
+
+        Returns:
+            ``True`` for each id whose row was deleted, ``False`` otherwise.
+        """
+        pk_col = self._pk_col
+        stmt = (
+            delete(self._model_cls)
+            .where(pk_col.in_(list(dict.fromkeys(ids))))
+            .returning(pk_col)
+            .execution_options(synchronize_session=False)
+        )
+        deleted = set(session.scalars(stmt))
+        return [id_value in deleted for id_value in ids]
+
+    def _delete_in_session(self, session: Session, id_value: IdT) -> bool:
+        """Delete a row by primary key within ``session``; ``False`` if not found.
+
+        Executes the prebuilt ``DELETE ... WHERE pk = :id`` in one round-trip, so
+        ORM-level cascades are not applied; rely on ``ON DELETE`` constraints instead.
+        """
+        # DML without RETURNING yields a CursorResult, which carries the rowcount
+        result = cast(
+            "CursorResult[Any]", session.execute(self._delete_by_pk, {"id": id_value})
+        )
+        return result.rowcount > 0
 
     # ---- Generic CRUD helpers (READ - synchronous) ---------------------------
     def get(self, id_value: IdT) -> Optional[ModelT]:
@@ -212,15 +841,31 @@ class DataAccessObject(Generic[ModelT, IdT], ABC):
         Returns:
             The detached model instance, or ``None`` if not found.
         """
+        return self._cached_read(
+            ("get", id_value),
+            lambda: self._run_in_session(
+                lambda session: self._get_in_session(session, id_value)
+            ),
+        )
 
-        def _op(session: Session) -> Optional[ModelT]:
-            model_any: Any = self.model
-            row = session.get(model_any, id_value)
-            if row is not None:
-                session.expunge(row)
-            return row
+    def get_many(self, ids: Sequence[IdT]) -> List[ModelT]:
+        """Fetch several model instances by primary key in a single round-trip.
+
+        Args:
+            ids: Primary key values to look up.
 
-        return self._run_in_session(_op)
+        Returns:
+            Detached model instances in the order of ``ids``; ids with no matching row
+            are omitted.
+
+        Examples:
+            >>> authors = dao.get_many([3, 1, 2])
+        """
+        if not ids:
+            return []
+        return self._run_in_session(
+            lambda session: self._get_many_in_session(session, ids)
+        )
 
     def list(self, *, limit: int = 100, offset: int = 0) -> List[ModelT]:
         """Retrieve a paginated list of model instances.
@@ -232,20 +877,11 @@ class DataAccessObject(Generic[ModelT, IdT], ABC):
         Returns:
             List of detached model instances.
         """
-
-        def _op(session: Session) -> List[ModelT]:
-            model_any = self.model
-            q = session.query(model_any)
-            if offset > 0:
-                q = q.offset(offset)
-            if limit > 0:
-                q = q.limit(limit)
-            rows = list(q.all())
-            for row in rows:
-                session.expunge(row)
-            return rows
-
-        return self._run_in_session(_op)
+        return self._run_in_session(
+            lambda session: self._list_in_session(
+                session, limit=limit, offset=offset, filters={}
+            )
+        )
 
     def list_by(
         self, limit: int = 100, offset: int = 0, **filters: Any
@@ -263,19 +899,15 @@ class DataAccessObject(Generic[ModelT, IdT], ABC):
         Examples:
             >>> dao.list_by(limit=50, status="active", role="admin")
         """
-
-        def _op(session: Session) -> List[ModelT]:
-            q = session.query(self.model).filter_by(**filters)
-            if offset > 0:
-                q = q.offset(offset)
-            if limit > 0:
-                q = q.limit(limit)
-            rows = list(q.all())
-            for row in rows:
-                session.expunge(row)
-            return rows
-
-        return self._run_in_session(_op)
+        rows = self._cached_read(
+            ("list_by", limit, offset, tuple(sorted(filters.items()))),
+            lambda: self._run_in_session(
+                lambda session: self._list_in_session(
+                    session, limit=limit, offset=offset, filters=filters
+                )
+            ),
+        )
+        return list(rows)
 
     def list_by_order_by(
         self, order_by: Any, *, limit: int = 100, offset: int = 0, **filters: Any
@@ -294,38 +926,62 @@ class DataAccessObject(Generic[ModelT, IdT], ABC):
         Examples:
             >>> dao.list_by_order_by(Model.created_at.desc(), limit=10, active=True)
         """
+        return self._run_in_session(
+            lambda session: self._list_in_session(
+                session, limit=limit, offset=offset, filters=filters, order_by=order_by
+            )
+        )
 
-        def _op(session: Session) -> List[ModelT]:
-            q = session.query(self.model).filter_by(**filters).order_by(order_by)
-            if offset > 0:
-                q = q.offset(offset)
-            if limit > 0:
-                q = q.limit(limit)
-            rows = list(q.all())
-            for row in rows:
+    def iter(
+        self, *, batch_size: int = 1000, order_by: Any = None, **filters: Any
+    ) -> Iterator[ModelT]:
+        """Stream model instances matching ``filters`` through a server-side cursor.
+
+        Rows are fetched ``batch_size`` at a time (``yield_per``) and detached as they
+        are yielded, so memory stays proportional to one batch rather than the full
+        result. The iterator holds its own session, separate from the thread's scoped
+        session, which stays open until the iterator is exhausted or closed; other DAO
+        calls made while iterating do not commit or close it.
+
+        Args:
+            batch_size: Number of rows fetched per round-trip; defaults to 1000.
+            order_by: Optional SQLAlchemy order expression.
+            **filters: Attribute equality filters applied via ``filter_by``.
+
+        Yields:
+            Detached model instances.
+
+        Examples:
+            >>> for order in dao.iter(status="pending"):
+            ...     process(order)
+        """
+        stmt = select(self._model_cls).filter_by(**filters)
+        if order_by is not None:
+            stmt = stmt.order_by(order_by)
+        with self._pg.get_session(scoped=False) as session:
+            result = session.scalars(stmt.execution_options(yield_per=batch_size))
+            for row in result:
                 session.expunge(row)
-            return rows
+                yield row
 
-        return self._run_in_session(_op)
+    def exists(self, id_value: IdT) -> bool:
+        """Check existence by primary key.
 
-    def exists(self, id_value: IdT) -> ModelT | None:
-        """Check existence by primary key and return the instance if found.
+        Issues ``SELECT 1`` rather than loading the row, so no columns are fetched
+        and no instance is hydrated; use :py:meth:`get` when the row is needed.
 
         Args:
             id_value: Primary key value to look up.
 
         Returns:
-            The detached model instance, or ``None`` if not found.
+            True if a row with the given primary key exists, False otherwise.
         """
-
-        def _op(session: Session) -> ModelT | None:
-            pk_col = self._get_pk_column()
-            res = session.query(self.model).filter(pk_col == id_value).first()
-            if res is not None:
-                session.expunge(res)
-            return res
-
-        return self._run_in_session(_op)
+        return self._cached_read(
+            ("exists", id_value),
+            lambda: self._run_in_session(
+                lambda session: self._exists_in_session(session, id_value)
+            ),
+        )
 
     # ---- Generic CRUD helpers (WRITE - synchronous) ---------------------------
     def create(self, **fields: Any) -> ModelT:
@@ -340,16 +996,10 @@ class DataAccessObject(Generic[ModelT, IdT], ABC):
         Examples:
             >>> user = dao.create(name="Alice", email="alice@example.com")
         """
-
-        def _write(session: Session) -> ModelT:
-            row = self.model(**fields)
-            session.add(row)
-            session.flush()
-            session.refresh(row)
-            session.expunge(row)
-            return row
-
-        return self._run_in_session(_write)
+        self._invalidate_request_cache()
+        return self._run_in_session(
+            lambda session: self._create_in_session(session, fields)
+        )
 
     def update(self, id_value: IdT, **fields: Any) -> Optional[ModelT]:
         """Update an existing model instance by primary key.
@@ -364,19 +1014,10 @@ class DataAccessObject(Generic[ModelT, IdT], ABC):
         Examples:
             >>> updated_user = dao.update(42, email="newemail@example.com")
         """
-
-        def _write(session: Session) -> Optional[ModelT]:
-            row = session.get(self.model, id_value)
-            if row is None:
-                return None
-            for key, value in fields.items():
-                setattr(row, key, value)
-            session.flush()
-            session.refresh(row)
-            session.expunge(row)
-            return row
-
-        return self._run_in_session(_write)
+        self._invalidate_request_cache()
+        return self._run_in_session(
+            lambda session: self._update_in_session(session, id_value, fields)
+        )
 
     def upsert(self, id_value: IdT, /, **fields: Any) -> ModelT:
         """Insert a new row or update an existing one by primary key.
@@ -391,28 +1032,10 @@ class DataAccessObject(Generic[ModelT, IdT], ABC):
         Examples:
             >>> user = dao.upsert(42, name="Bob", email="bob@example.com")
         """
-
-        def _write(session: Session) -> ModelT:
-            model_class: Any = self.model
-            existing_row = session.get(model_class, id_value)
-            if existing_row is None:
-                row_data: dict[str, Any] = {self.primary_key_attribute_name: id_value}
-                row_data.update(fields)
-                new_row = model_class(**row_data)
-                session.add(new_row)
-                session.flush()
-                session.refresh(new_row)
-                session.expunge(new_row)
-                return new_row
-
-            for key, value in fields.items():
-                setattr(existing_row, key, value)
-            session.flush()
-            session.refresh(existing_row)
-            session.expunge(existing_row)
-            return existing_row
-
-        return self._run_in_session(_write)
+        self._invalidate_request_cache()
+        return self._run_in_session(
+            lambda session: self._upsert_in_session(session, id_value, fields)
+        )
 
     def delete(self, id_value: IdT) -> bool:
         """Delete a model instance by primary key.
@@ -423,19 +1046,192 @@ class DataAccessObject(Generic[ModelT, IdT], ABC):
         Returns:
             ``True`` if the row was found and deleted, ``False`` otherwise.
 
+        Note:
+            Deletes with a single SQL statement; ORM relationship cascades are not
+            applied, so configure ``ON DELETE`` on foreign keys instead.
+
         Examples:
             >>> was_deleted = dao.delete(42)
         """
+        self._invalidate_request_cache()
+        return self._run_in_session(
+            lambda session: self._delete_in_session(session, id_value)
+        )
+
+    def bulk_create(self, rows: List[dict[str, Any]]) -> List[ModelT]:
+        """Create many model instances in a single session.
+
+        Args:
+            rows: One dictionary of attributes per instance to create.
+
+        Returns:
+            The detached, persisted model instances in the same order as ``rows``.
+
+        Examples:
+            >>> users = dao.bulk_create([{"name": "Alice"}, {"name": "Bob"}])
+        """
+        self._invalidate_request_cache()
+        return self._run_in_session(
+            lambda session: self._bulk_create_in_session(session, rows)
+        )
+
+    def bulk_update(self, rows: List[dict[str, Any]]) -> None:
+        """Update many model instances by primary key in a single session.
+
+        Args:
+            rows: One dictionary per row; each must contain the primary key attribute
+                plus the attributes to update.
+
+        Examples:
+            >>> dao.bulk_update([{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}])
+        """
+        self._invalidate_request_cache()
+        self._run_in_session(
+            lambda session: self._bulk_update_in_session(session, rows)
+        )
+
+    # ---- Native asyncio counterparts -----------------------------------------
+    async def aget(self, id_value: IdT) -> Optional[ModelT]:
+        """Fetch a single model instance by primary key on the asyncio engine.
+
+        See Also:
+            :py:meth:`get`
+        """
+        return await self._cached_read_async(
+            ("get", id_value),
+            lambda: self._run_in_session_async(
+                lambda session: self._get_in_session(session, id_value)
+            ),
+        )
 
-        def _write(session: Session) -> bool:
-            row = session.get(self.model, id_value)
-            if row is None:
-                return False
-            session.delete(row)
-            session.flush()
-            return True
+    async def aget_many(self, ids: Sequence[IdT]) -> List[ModelT]:
+        """Fetch several model instances by primary key on the asyncio engine.
 
-        return self._run_in_session(_write)
+        See Also:
+            :py:meth:`get_many`
+        """
+        if not ids:
+            return []
+        return await self._run_in_session_async(
+            lambda session: self._get_many_in_session(session, ids)
+        )
+
+    async def alist(self, *, limit: int = 100, offset: int = 0) -> List[ModelT]:
+        """Retrieve a paginated list of model instances on the asyncio engine.
+
+        See Also:
+            :py:meth:`list`
+        """
+        return await self._run_in_session_async(
+            lambda session: self._list_in_session(
+                session, limit=limit, offset=offset, filters={}
+            )
+        )
+
+    async def alist_by(
+        self, limit: int = 100, offset: int = 0, **filters: Any
+    ) -> List[ModelT]:
+        """Retrieve a filtered, paginated list of model instances on the asyncio engine.
+
+        See Also:
+            :py:meth:`list_by`
+        """
+        rows = await self._cached_read_async(
+            ("list_by", limit, offset, tuple(sorted(filters.items()))),
+            lambda: self._run_in_session_async(
+                lambda session: self._list_in_session(
+                    session, limit=limit, offset=offset, filters=filters
+                )
+            ),
+        )
+        return list(rows)
+
+    async def alist_by_order_by(
+        self, order_by: Any, *, limit: int = 100, offset: int = 0, **filters: Any
+    ) -> List[ModelT]:
+        """Retrieve a filtered, sorted, paginated list on the asyncio engine.
+
+        See Also:
+            :py:meth:`list_by_order_by`
+        """
+        return await self._run_in_session_async(
+            lambda session: self._list_in_session(
+                session, limit=limit, offset=offset, filters=filters, order_by=order_by
+            )
+        )
+
+    async def aexists(self, id_value: IdT) -> bool:
+        """Check existence by primary key on the asyncio engine.
+
+        See Also:
+            :py:meth:`exists`
+        """
+        return await self._cached_read_async(
+            ("exists", id_value),
+            lambda: self._run_in_session_async(
+                lambda session: self._exists_in_session(session, id_value)
+            ),
+        )
+
+    async def acreate(self, **fields: Any) -> ModelT:
+        """Create a new model instance on the asyncio engine.
+
+        See Also:
+            :py:meth:`create`
+        """
+        return await self._write_in_session_async(
+            lambda session: self._create_in_session(session, fields)
+        )
+
+    async def aupdate(self, id_value: IdT, **fields: Any) -> Optional[ModelT]:
+        """Update an existing model instance by primary key on the asyncio engine.
+
+        See Also:
+            :py:meth:`update`
+        """
+        return await self._write_in_session_async(
+            lambda session: self._update_in_session(session, id_value, fields)
+        )
+
+    async def aupsert(self, id_value: IdT, /, **fields: Any) -> ModelT:
+        """Insert or update a row by primary key on the asyncio engine.
+
+        See Also:
+            :py:meth:`upsert`
+        """
+        return await self._write_in_session_async(
+            lambda session: self._upsert_in_session(session, id_value, fields)
+        )
+
+    async def abulk_create(self, rows: List[dict[str, Any]]) -> List[ModelT]:
+        """Create many model instances in a single session on the asyncio engine.
+
+        See Also:
+            :py:meth:`bulk_create`
+        """
+        return await self._write_in_session_async(
+            lambda session: self._bulk_create_in_session(session, rows)
+        )
+
+    async def abulk_update(self, rows: List[dict[str, Any]]) -> None:
+        """Update many model instances by primary key on the asyncio engine.
+
+        See Also:
+            :py:meth:`bulk_update`
+        """
+        await self._write_in_session_async(
+            lambda session: self._bulk_update_in_session(session, rows)
+        )
+
+    async def adelete(self, id_value: IdT) -> bool:
+        """Delete a model instance by primary key on the asyncio engine.
+
+        See Also:
+            :py:meth:`delete`
+        """
+        return await self._write_in_session_async(
+            lambda session: self._delete_in_session(session, id_value)
+        )
 
     # ---- Fire-and-forget counterparts (return Future) -----------------------
     def create_ff(self, **fields: Any) -> Future[ModelT]:
@@ -447,19 +1243,16 @@ class DataAccessObject(Generic[ModelT, IdT], ABC):
         Returns:
             A :py:class:`~concurrent.futures.Future` yielding the detached model instance.
 
+        Note:
+            Creates queued within a few milliseconds of each other are coalesced by the
+            batch worker into one multi-row ``INSERT ... RETURNING``.
+
         See Also:
             :py:meth:`create`
         """
-
-        def _write(session: Session) -> ModelT:
-            row_any: Any = self.model(**fields)
-            session.add(row_any)
-            session.flush()
-            session.refresh(row_any)
-            session.expunge(row_any)
-            return row_any
-
-        return self._submit_background(_write)
+        return self._invalidate_request_cache_on_done(
+            self._submit_batched("create", fields)
+        )
 
     def update_ff(self, id_value: IdT, **fields: Any) -> Future[Optional[ModelT]]:
         """Submit an update operation to run asynchronously in the background.
@@ -471,10 +1264,16 @@ class DataAccessObject(Generic[ModelT, IdT], ABC):
         Returns:
             A :py:class:`~concurrent.futures.Future` yielding the updated instance or ``None``.
 
+        Note:
+            Queued updates are coalesced by the batch worker into one
+            ``UPDATE ... FROM (VALUES ...)`` per set of updated columns.
+
         See Also:
             :py:meth:`update`
         """
-        return self._submit_background(lambda session: self.update(id_value, **fields))
+        return self._invalidate_request_cache_on_done(
+            self._submit_batched("update", (id_value, fields))
+        )
 
     def upsert_ff(self, id_value: IdT, /, **fields: Any) -> Future[ModelT]:
         """Submit an upsert operation to run asynchronously in the background.
@@ -489,7 +1288,11 @@ class DataAccessObject(Generic[ModelT, IdT], ABC):
         See Also:
             :py:meth:`upsert`
         """
-        return self._submit_background(lambda session: self.upsert(id_value, **fields))
+        return self._invalidate_request_cache_on_done(
+            self._submit_background(
+                lambda session: self._upsert_in_session(session, id_value, fields)
+            )
+        )
 
     def delete_ff(self, id_value: IdT) -> Future[bool]:
         """Submit a delete operation to run asynchronously in the background.
@@ -500,20 +1303,16 @@ class DataAccessObject(Generic[ModelT, IdT], ABC):
         Returns:
             A :py:class:`~concurrent.futures.Future` yielding ``True`` if deleted, ``False`` otherwise.
 
+        Note:
+            Queued deletes are coalesced by the batch worker into one
+            ``DELETE ... WHERE pk IN (...)``, which bypasses ORM-level cascades.
+
         See Also:
             :py:meth:`delete`
         """
-
-        def _write(session: Session) -> bool:
-            model_any: Any = self.model
-            row = session.get(model_any, id_value)
-            if row is None:
-                return False
-            session.delete(row)
-            session.flush()
-            return True
-
-        return self._submit_background(_write)
+        return self._invalidate_request_cache_on_done(
+            self._submit_batched("delete", id_value)
+        )
 
     # ---- Utility hooks --------------------------------------------------------
     def run_custom(self, fn: Callable[[Session], SyncResultT]) -> SyncResultT:
@@ -529,23 +1328,48 @@ class DataAccessObject(Generic[ModelT, IdT], ABC):
 
         Examples:
             >>> def complex_query(session: Session) -> List[Model]:
-            ...     return session.query(Model).filter(...).all()
+            ...     return list(session.scalars(select(Model).where(...)))
             >>> results = dao.run_custom(complex_query)
         """
+        self._invalidate_request_cache()
         return self._run_in_session(fn)
 
+    async def arun_custom(self, fn: Callable[[Session], SyncResultT]) -> SyncResultT:
+        """Execute a custom session callable on the asyncio engine.
+
+        Args:
+            fn: Callable receiving a :py:class:`~sqlalchemy.orm.Session` and returning a result.
+
+        Returns:
+            The result of invoking ``fn``.
+
+        See Also:
+            :py:meth:`run_custom`
+        """
+        return await self._write_in_session_async(fn)
+
     def close(self) -> None:
         """Dispose the connection pool and clean up resources.
 
         Should be called when the DAO is no longer needed to release database connections.
+        Waits for fire-and-forget writes queued on this engine to be flushed first.
         Logs errors if disposal fails.
         """
+        pending = self._batch_queues.get(self._pg._engine_key)
+        if pending is not None:
+            self._wait_for_batch_queue(pending)
         try:
             self._pg.close_engine()
         except Exception as e:
-            print(str(e))
-            self._logger.error(
-                "Failed to close database engine",
-                exception=e,
-                logger_name=self.__class__.__name__,
-            )
+            self._log_error("Failed to close database engine", e)
+
+    async def aclose(self) -> None:
+        """Dispose the asyncio connection pool.
+
+        Call this from the event loop that used the async API; the synchronous pool
+        is released by :py:meth:`close`. Logs errors if disposal fails.
+        """
+        try:
+            await self._pg.close_async_engine()
+        except Exception as e:
+            self._log_error("Failed to close async database engine", e)
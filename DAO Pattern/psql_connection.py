@@ -1,12 +1,22 @@
 import os
 import re
-from contextlib import contextmanager
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from importlib.util import find_spec
+from typing import AsyncIterator, cast
 from urllib.parse import quote_plus
 
 from dotenv import find_dotenv, load_dotenv
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine
+from sqlalchemy.engine.url import URL
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, scoped_session, sessionmaker
 from sqlalchemy.pool import QueuePool
 
@@ -16,11 +26,25 @@ load_dotenv(find_dotenv(), override=True)
 
 class PostgresConnection:
     _engines: dict[
-        str, Engine
+        tuple[str, str], Engine
     ] = {}  # Class variable to store engines for different databases
     _sessions: dict[
-        str, scoped_session[Session]
+        tuple[str, str], scoped_session[Session]
     ] = {}  # Class variable to store session factories
+    _async_engines: dict[
+        tuple[str, str], AsyncEngine
+    ] = {}  # Class variable to store asyncio engines (asyncpg driver)
+    _async_sessions: dict[
+        tuple[str, str], async_sessionmaker[AsyncSession]
+    ] = {}  # Class variable to store asyncio session factories
+    _refcounts: dict[
+        tuple[str, str], int
+    ] = {}  # Class variable counting live connections sharing each engine
+    _lock = threading.Lock()  # Guards engine creation and reference counting
+    _keepalive_thread: threading.Thread | None = None  # Pings idle pooled connections
+    _keepalive_stop: threading.Event | None = None  # Set to stop the keepalive thread
+    _keepalive_interval: float = 300.0  # Seconds between keepalive passes
+    _asyncpg_installed: bool = find_spec("asyncpg") is not None  # Checked at import
 
     def __init__(
         self,
@@ -66,6 +90,11 @@ class PostgresConnection:
         self.db_host = os.getenv("DB_HOST", "localhost")
         self.db_port = int(os.getenv("DB_PORT", "5432"))
 
+        # Every connection to the same database with the same credentials
+        # shares a single engine (and therefore a single connection pool)
+        self._engine_key = (self.database_name, self.db_user)
+        self._released = False
+
         if create_if_not_exists:
             self._ensure_database(self.database_name)
 
@@ -82,48 +111,138 @@ class PostgresConnection:
         # allow only letters, digits, and _
         return re.sub(r"[^0-9A-Za-z_]", "_", raw.lower())
 
+    def _build_url(self, drivername: str) -> URL:
+        """Build the connection URL for this database using the given driver"""
+        if self.db_host.startswith("/cloudsql"):
+            assert os.path.exists(self.db_host), (
+                f"Cloud SQL socket not mounted: {self.db_host}"
+            )
+            # Use Unix socket (Cloud SQL)
+            return URL.create(
+                drivername=drivername,
+                username=self.db_user,
+                password=self.db_password_raw,
+                database=self.database_name,
+                host=self.db_host,
+            )
+        # Use TCP connection
+        return URL.create(
+            drivername=drivername,
+            username=self.db_user,
+            password=self.db_password_raw,
+            database=self.database_name,
+            host=self.db_host,
+            port=self.db_port,
+        )
+
     def _initialize_engine(self) -> None:
-        """Initialize the SQLAlchemy engine if it doesn't exist for this database"""
-        if self.database_name not in PostgresConnection._engines:
-            try:
-                from sqlalchemy.engine.url import URL
+        """Initialize the SQLAlchemy engine if it doesn't exist for this database
 
-                if self.db_host.startswith("/cloudsql"):
-                    assert os.path.exists(self.db_host), (
-                        f"Cloud SQL socket not mounted: {self.db_host}"
-                    )
-                    # Use Unix socket (Cloud SQL)
-                    db_url = URL.create(
-                        drivername="postgresql+psycopg2",
-                        username=self.db_user,
-                        password=self.db_password_raw,
-                        database=self.database_name,
-                        host=self.db_host,
-                    )
-                else:
-                    # Use TCP connection
-                    db_url = URL.create(
-                        drivername="postgresql+psycopg2",
-                        username=self.db_user,
-                        password=self.db_password_raw,
-                        database=self.database_name,
-                        host=self.db_host,
-                        port=self.db_port,
-                    )
-                engine = create_engine(
-                    db_url,
-                    poolclass=QueuePool,
+        The engine is shared by every connection using the same database and
+        user; each call takes a reference that is released by close_engine.
+        """
+        with PostgresConnection._lock:
+            if self._engine_key not in PostgresConnection._engines:
+                self._create_engine()
+            PostgresConnection._refcounts[self._engine_key] = (
+                PostgresConnection._refcounts.get(self._engine_key, 0) + 1
+            )
+            PostgresConnection._start_keepalive()
+
+    def _create_engine(self) -> None:
+        """Create the engine and session factory; caller must hold the lock"""
+        try:
+            engine = create_engine(
+                self._build_url("postgresql+psycopg2"),
+                poolclass=QueuePool,
+                pool_size=self.max_connections,
+                max_overflow=0,
+                # Idle connections are checked by the keepalive thread instead of
+                # a round-trip on every checkout; recycle bounds connection age
+                pool_pre_ping=False,
+                pool_recycle=1800,
+            )
+            # Keep loaded state on commit so instances stay usable once detached
+            session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+            PostgresConnection._engines[self._engine_key] = engine
+            PostgresConnection._sessions[self._engine_key] = scoped_session(
+                session_factory
+            )
+        except Exception as e:
+            raise Exception(f"Error creating database engine: {str(e)}")
+
+    @classmethod
+    def _start_keepalive(cls) -> None:
+        """Start the keepalive thread if it isn't running; caller must hold the lock"""
+        if cls._keepalive_thread is not None and cls._keepalive_thread.is_alive():
+            return
+        cls._keepalive_stop = threading.Event()
+        cls._keepalive_thread = threading.Thread(
+            target=cls._keepalive_loop,
+            args=(cls._keepalive_stop,),
+            name="pg-keepalive",
+            daemon=True,
+        )
+        cls._keepalive_thread.start()
+
+    @classmethod
+    def _stop_keepalive(cls) -> None:
+        """Signal the keepalive thread to exit; caller must hold the lock"""
+        if cls._keepalive_stop is not None:
+            cls._keepalive_stop.set()
+        cls._keepalive_thread = None
+
+    @classmethod
+    def _keepalive_loop(cls, stop: threading.Event) -> None:
+        """Periodically ping idle pooled connections until ``stop`` is set
+
+        Pools are FIFO, so checking out and returning a connection once per idle
+        connection touches each of them. A ping that fails invalidates its
+        connection, which the pool then replaces on the next checkout.
+        """
+        while not stop.wait(cls._keepalive_interval):
+            with cls._lock:
+                engines = list(cls._engines.values())
+            for engine in engines:
+                # Engines are always built with a QueuePool
+                for _ in range(cast(QueuePool, engine.pool).checkedin()):
+                    try:
+                        with engine.connect() as conn:
+                            conn.execute(text("SELECT 1"))
+                    except Exception:
+                        # Dead connection was invalidated; carry on with the rest
+                        continue
+
+    @staticmethod
+    def async_driver_available() -> bool:
+        """Return True if the asyncpg driver is installed"""
+        return PostgresConnection._asyncpg_installed
+
+    def _initialize_async_engine(self) -> None:
+        """Initialize the asyncio engine if it doesn't exist for this database
+
+        Created lazily on first use so that the asyncpg driver stays optional
+        for purely synchronous callers. Called on every async session, so the
+        common already-created case is checked before taking the shared lock.
+        """
+        if self._engine_key in PostgresConnection._async_engines:
+            return
+        with PostgresConnection._lock:
+            if self._engine_key in PostgresConnection._async_engines:
+                return
+            try:
+                engine = create_async_engine(
+                    self._build_url("postgresql+asyncpg"),
                     pool_size=self.max_connections,
                     max_overflow=0,
                     pool_pre_ping=True,
                 )
-                session_factory = sessionmaker(bind=engine)
-                PostgresConnection._engines[self.database_name] = engine
-                PostgresConnection._sessions[self.database_name] = scoped_session(
-                    session_factory
+                PostgresConnection._async_engines[self._engine_key] = engine
+                PostgresConnection._async_sessions[self._engine_key] = (
+                    async_sessionmaker(engine, expire_on_commit=False)
                 )
             except Exception as e:
-                raise Exception(f"Error creating database engine: {str(e)}")
+                raise Exception(f"Error creating async database engine: {str(e)}")
 
     def _ensure_database(self, dbname: str):
         from sqlalchemy import text
@@ -151,15 +270,20 @@ class PostgresConnection:
         admin_engine.dispose()
 
     @contextmanager
-    def get_session(self):
+    def get_session(self, scoped: bool = True):
         """
         Get a session using context manager
 
+        Args:
+            scoped: Use the calling thread's scoped session; pass False for a new
+                session that is independent of it (e.g. one held open by a generator)
+
         Usage:
             with postgres.get_session() as session:
                 results = session.query(Model).all()
         """
-        session = PostgresConnection._sessions[self.database_name]()
+        factory = PostgresConnection._sessions[self._engine_key]
+        session = factory() if scoped else factory.session_factory()
         try:
             yield session
             session.commit()
@@ -169,22 +293,78 @@ class PostgresConnection:
         finally:
             session.close()
 
+    @asynccontextmanager
+    async def get_async_session(self) -> AsyncIterator[AsyncSession]:
+        """
+        Get an asyncio session using async context manager
+
+        Sessions are created with ``expire_on_commit=False`` so that returned
+        instances stay loaded after the transaction commits.
+
+        Usage:
+            async with postgres.get_async_session() as session:
+                results = (await session.execute(select(Model))).scalars().all()
+        """
+        self._initialize_async_engine()
+        session = PostgresConnection._async_sessions[self._engine_key]()
+        try:
+            yield session
+            await session.commit()
+        except SQLAlchemyError:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
     @classmethod
     def close_all_engines(cls) -> None:
         """Dispose all engines"""
-        for engine in cls._engines.values():
-            if engine:
-                engine.dispose()
-        cls._engines.clear()
-        cls._sessions.clear()
+        with cls._lock:
+            cls._stop_keepalive()
+            for engine in cls._engines.values():
+                if engine:
+                    engine.dispose()
+            cls._engines.clear()
+            cls._sessions.clear()
+            cls._refcounts.clear()
 
     def close_engine(self) -> None:
-        """Dispose the engine for this specific database"""
-        if self.database_name in PostgresConnection._engines:
-            PostgresConnection._engines[self.database_name].dispose()
-            del PostgresConnection._engines[self.database_name]
-            del PostgresConnection._sessions[self.database_name]
+        """Release this connection's reference to the shared engine
+
+        The engine is only disposed once the last connection sharing it has
+        been closed, and the keepalive thread stops with the last engine.
+        Calling this more than once is a no-op.
+        """
+        with PostgresConnection._lock:
+            if self._released:
+                return
+            self._released = True
+            remaining = PostgresConnection._refcounts.get(self._engine_key, 0) - 1
+            if remaining > 0:
+                PostgresConnection._refcounts[self._engine_key] = remaining
+                return
+            PostgresConnection._refcounts.pop(self._engine_key, None)
+            engine = PostgresConnection._engines.pop(self._engine_key, None)
+            PostgresConnection._sessions.pop(self._engine_key, None)
+            if not PostgresConnection._engines:
+                # Nothing left to ping; the next engine created restarts it
+                PostgresConnection._stop_keepalive()
+        if engine is not None:
+            engine.dispose()
+
+    async def close_async_engine(self) -> None:
+        """Dispose the asyncio engine unless other connections still share it"""
+        with PostgresConnection._lock:
+            others = PostgresConnection._refcounts.get(self._engine_key, 0)
+            if not self._released:
+                others -= 1
+            if others > 0:
+                return
+            engine = PostgresConnection._async_engines.pop(self._engine_key, None)
+            PostgresConnection._async_sessions.pop(self._engine_key, None)
+        if engine is not None:
+            await engine.dispose()
 
     def get_engine(self) -> Engine:
         """Return the SQLAlchemy engine for this database."""
-        return PostgresConnection._engines[self.database_name]
+        return PostgresConnection._engines[self._engine_key]
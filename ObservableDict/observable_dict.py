@@ -1,9 +1,64 @@
-from collections.abc import ItemsView, Iterable, KeysView, Mapping, ValuesView
-from typing import Any, Callable, Dict, Optional, Tuple, TypeVar, cast
+from collections.abc import (
+    ItemsView,
+    Iterable,
+    Iterator,
+    KeysView,
+    Mapping,
+    Sequence,
+    ValuesView,
+)
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import MethodType
+from typing import Any, Callable, ClassVar, Dict, Optional, Tuple, TypeVar, cast
+from weakref import WeakMethod
 
 K = TypeVar("K")
 V = TypeVar("V")
 
+# Unbound dict primitives used by the mutators below. Calling these directly
+# skips building a super() proxy and walking the MRO on every write.
+_dict_setitem = dict.__setitem__
+_dict_delitem = dict.__delitem__
+_dict_pop = dict.pop
+_dict_popitem = dict.popitem
+_dict_clear = dict.clear
+_dict_update = dict.update
+_dict_items = dict.items
+_dict_copy = dict.copy
+_dict_setdefault = dict.setdefault
+
+# Operation names passed to the ``on_change`` callback.
+_OP_SET = "set"
+_OP_UPDATE = "update"
+_OP_POP = "pop"
+_OP_POPITEM = "popitem"
+_OP_CLEAR = "clear"
+_OP_DELITEM = "delitem"
+_OP_SETDEFAULT = "setdefault"
+_OP_BATCH = "batch"
+_OP_BULK_LOAD = "bulk_load"
+
+# True while notifications are suppressed in the current thread / async context.
+_SUPPRESS: ContextVar[bool] = ContextVar("observable_dict_suppress", default=False)
+
+# Marks "no default given" for pop(), so that an explicit None default is honoured.
+_MISSING: Any = object()
+
+
+def _weak_callback(on_change: Optional[Callable[..., None]]) -> Any:
+    """Hold bound-method callbacks through a `WeakMethod`, others as they are.
+
+    Methods of objects that cannot be weakly referenced (e.g. `__slots__`
+    classes without `__weakref__`) are held strongly instead.
+    """
+    if isinstance(on_change, MethodType):
+        try:
+            return WeakMethod(on_change)
+        except TypeError:
+            return on_change
+    return on_change
+
 
 class ObservableDict(Dict[K, V]):
     """An observable dictionary that provides change notifications for mutations.
@@ -13,7 +68,8 @@ class ObservableDict(Dict[K, V]):
     `on_change(operation, items)`.
 
     **Important:** The callback function is called with best-effort error handling. If the callback
-    raises an exception, it will be silently ignored to prevent disrupting the dictionary operations.
+    raises an exception, it will not disrupt the dictionary operations: the exception is passed to
+    the handler registered with `set_callback_error_handler()`, or silently ignored if there is none.
 
     ## Type Parameters
 
@@ -30,22 +86,27 @@ class ObservableDict(Dict[K, V]):
     The `on_change` callback receives two parameters:
 
     - **operation** (`str`): Describes the mutation type: `"set"`, `"update"`, `"pop"`,
-      `"popitem"`, `"clear"`, `"delitem"`, or `"setdefault"`
-    - **items** (`list` of `tuple`s): List of `(key, value)` tuples relevant to the operation
+      `"popitem"`, `"clear"`, `"delitem"`, `"setdefault"`, `"batch"` (see `batch()`), or
+      `"bulk_load"` (see `bulk_load()`)
+    - **items** (`Sequence` of `tuple`s): The `(key, value)` tuples relevant to the operation.
+      Single-item operations (`"set"`, `"delitem"`, `"pop"`, `"popitem"`, `"setdefault"`)
+      pass a one-element `tuple`; `"update"` and `"batch"` pass a `list`; `"clear"` and `"bulk_load"`
+      pass a read-only sequence that only builds its tuples when it is read. Callbacks should
+      only rely on iteration, indexing and `len()`.
 
     ## Example Usage
 
     ```python
-    def on_change(operation: str, items: list) -> None:
+    def on_change(operation: str, items: Sequence) -> None:
         print(f"Operation: {operation}, Items: {items}")
 
     # Create an observable dictionary
     obs_dict = ObservableDict[str, int]({"a": 1, "b": 2}, on_change=on_change)
 
     # Mutations will trigger notifications
-    obs_dict["c"] = 3  # Triggers: operation="set", items=[("c", 3)]
+    obs_dict["c"] = 3  # Triggers: operation="set", items=(("c", 3),)
     obs_dict.update({"d": 4, "e": 5})  # Triggers: operation="update", items=[("d", 4), ("e", 5)]
-    obs_dict.pop("a")  # Triggers: operation="pop", items=[("a", 1)]
+    obs_dict.pop("a")  # Triggers: operation="pop", items=(("a", 1),)
     ```
 
     ## Thread Safety
@@ -71,10 +132,17 @@ class ObservableDict(Dict[K, V]):
     - `ObservableList`: Similar observable pattern for lists
     """
 
+    # Keep the callback in a fixed slot instead of a per-instance __dict__;
+    # __weakref__ preserves weak-reference support that a plain subclass gets.
+    __slots__ = ("_on_change", "_has_cb", "_batch_buffer", "__weakref__")
+
+    # Receives exceptions raised by callbacks; None discards them
+    _callback_error_handler: ClassVar[Optional[Callable[[Exception], None]]] = None
+
     def __init__(
         self,
         initial: Optional[Mapping[K, V] | Iterable[Tuple[K, V]]] = None,
-        on_change: Optional[Callable[[str, list[Tuple[K, V]]], None]] = None,
+        on_change: Optional[Callable[[str, Sequence[Tuple[K, V]]], None]] = None,
         **kwargs: V,
     ) -> None:
         """Initialize an ObservableDict with optional initial data and change callback.
@@ -86,10 +154,11 @@ class ObservableDict(Dict[K, V]):
             - An iterable of (key, value) tuples
             - None for an empty dictionary
         - **on_change**: Optional callback function that will be called on mutations.
-            The callback signature is: `on_change(operation: str, items: list[Tuple[K, V]]) -> None`
+            The callback signature is: `on_change(operation: str, items: Sequence[Tuple[K, V]]) -> None`
             where:
             - `operation` describes the type of mutation performed
             - `items` contains the affected key-value pairs
+            Bound methods are held weakly (see `set_on_change()`).
         - **kwargs**: Additional key-value pairs to initialize the dictionary with.
             These are processed after the `initial` parameter.
 
@@ -102,36 +171,63 @@ class ObservableDict(Dict[K, V]):
             super().__init__(**kwargs)
         else:
             super().__init__(initial, **kwargs)
-        self._on_change: Optional[Callable[[str, list[Tuple[K, V]]], None]] = on_change
+        # Either the callback itself or a WeakMethod wrapping a bound method
+        self._on_change: Any = _weak_callback(on_change)
+        # Mirrors "self._on_change is not None" for the mutators' hot-path check
+        self._has_cb = on_change is not None
+        self._batch_buffer: Optional[list[Tuple[K, V]]] = None
+        # Match the class to the callback: re-running __init__ on, or constructing
+        # via type() of, an unobserved dict must switch back to ObservableDict
+        if on_change is None:
+            if type(self) is ObservableDict:
+                self.__class__ = _PlainObservableDict
+        elif type(self) is _PlainObservableDict:
+            self.__class__ = ObservableDict  # type: ignore[assignment]
 
     def set_on_change(
-        self, on_change: Optional[Callable[[str, list[Tuple[K, V]]], None]]
+        self, on_change: Optional[Callable[[str, Sequence[Tuple[K, V]]], None]]
     ) -> None:
         """Set or update the change notification callback.
 
         ## Args
 
         - **on_change**: The callback function to call on mutations, or None to disable notifications.
-            The callback signature is: `on_change(operation: str, items: list[Tuple[K, V]]) -> None`
+            The callback signature is: `on_change(operation: str, items: Sequence[Tuple[K, V]]) -> None`
             where:
-            - `operation` is one of: "set", "update", "pop", "popitem", "clear", "delitem", "setdefault"
-            - `items` is a list of (key, value) tuples affected by the operation
+            - `operation` is one of: "set", "update", "pop", "popitem", "clear", "delitem", "setdefault", "batch", "bulk_load"
+            - `items` is a sequence of (key, value) tuples affected by the operation
 
         ## Note
 
         Setting the callback to None will disable change notifications. The callback
-        is called with best-effort error handling - exceptions in the callback are
-        silently ignored to prevent disrupting dictionary operations.
+        is called with best-effort error handling - exceptions in the callback never
+        disrupt dictionary operations; they are reported to the handler set with
+        `set_callback_error_handler()`, or ignored if no handler is set.
 
         This method can be called multiple times to change the callback during
         the dictionary's lifetime.
 
+        Bound methods (`observer.handle`) are held through a `weakref.WeakMethod`,
+        so the dictionary never keeps its observer alive or forms a reference
+        cycle with it. Once the observer is garbage collected, the callback is
+        detached automatically on the next notification. Keep a reference to the
+        observer for as long as it should receive notifications. Plain functions,
+        other callables, and methods of objects that do not support weak
+        references are held strongly.
+
+        While no callback is set, a plain `ObservableDict` switches to an internal
+        subclass whose mutators are `dict`'s own, so unobserved instances pay no
+        notification overhead at all. Setting a callback switches it back. The
+        instance remains an `ObservableDict` for `isinstance` checks, but
+        `type(obs_dict)` reflects the current mode. Subclasses of `ObservableDict`
+        are never switched.
+
         ## Example
 
         ```python
         obs_dict = ObservableDict[str, int]()
 
-        def my_callback(operation: str, items: list) -> None:
+        def my_callback(operation: str, items: Sequence) -> None:
             print(f"Dictionary changed: {operation} -> {items}")
 
         # Set the callback
@@ -139,7 +235,7 @@ class ObservableDict(Dict[K, V]):
         obs_dict["key"] = 42  # Will trigger callback
 
         # Change to a different callback
-        def another_callback(operation: str, items: list) -> None:
+        def another_callback(operation: str, items: Sequence) -> None:
             print(f"Different handler: {operation}")
 
         obs_dict.set_on_change(another_callback)
@@ -149,36 +245,202 @@ class ObservableDict(Dict[K, V]):
         obs_dict["key2"] = 100  # No callback triggered
         ```
         """
-        self._on_change = on_change
+        self._on_change = _weak_callback(on_change)
+        self._has_cb = on_change is not None
+        if on_change is None and type(self) is ObservableDict:
+            self.__class__ = _PlainObservableDict
+
+    @classmethod
+    def set_callback_error_handler(
+        cls, handler: Optional[Callable[[Exception], None]]
+    ) -> None:
+        """Set the handler that receives exceptions raised by change callbacks.
+
+        ## Args
+
+        - **handler**: Callable invoked with the exception whenever an `on_change`
+            callback raises, or None to go back to ignoring callback errors.
+
+        ## Note
+
+        The handler applies to every instance of this class and its subclasses.
+        It is called after the mutation has been applied, so the dictionary is
+        always left in its updated state. Exceptions raised by the handler
+        itself propagate to the caller of the mutating method.
+
+        ## Example
+
+        ```python
+        import logging
+
+        ObservableDict.set_callback_error_handler(
+            lambda exc: logging.exception("on_change callback failed", exc_info=exc)
+        )
+        ```
+        """
+        cls._callback_error_handler = handler
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Coalesce all notifications inside the block into a single "batch" event.
+
+        ## Note
+
+        While the block runs, mutations are applied immediately but their
+        notifications are buffered. On exit (including exit via an exception) the
+        callback is called once with operation `"batch"` and a list of every
+        `(key, value)` pair reported inside the block, in order. The individual
+        operation names are not preserved, so a deleted key appears with the
+        value it had when it was removed. No event is sent if nothing changed.
+
+        Nested `batch()` blocks join the outermost one.
+
+        This is useful when the callback is expensive (I/O, serialization, UI
+        refreshes) and a group of mutations can be handled at once.
+
+        ## Example
+
+        ```python
+        obs_dict = ObservableDict[str, int](on_change=my_callback)
+
+        with obs_dict.batch():
+            obs_dict["a"] = 1
+            obs_dict["b"] = 2
+            del obs_dict["a"]
+        # Triggers once: operation="batch", items=[("a", 1), ("b", 2), ("a", 1)]
+        ```
+        """
+        if self._batch_buffer is not None:
+            yield
+            return
+        self._batch_buffer = []
+        try:
+            yield
+        finally:
+            buffered, self._batch_buffer = self._batch_buffer, None
+            if buffered:
+                self._notify(_OP_BATCH, buffered)
+
+    @staticmethod
+    @contextmanager
+    def suppress_notifications() -> Iterator[None]:
+        """Silence change notifications from every `ObservableDict` inside the block.
+
+        ## Note
+
+        Mutations inside the block are applied but not reported at all: callbacks
+        are not called and open `batch()` blocks do not record them. Suppression
+        is stored in a `ContextVar`, so it only affects the current thread (or
+        asyncio task) and is safe to nest.
+
+        Use this to restore or bulk-load state into existing dictionaries
+        without a flood of notifications, then inform observers yourself if
+        needed.
+
+        ## Example
+
+        ```python
+        obs_dict = ObservableDict[str, int](on_change=my_callback)
+
+        with ObservableDict.suppress_notifications():
+            obs_dict.update(load_state_from_disk())  # No notification
+        obs_dict["ready"] = 1  # Triggers: operation="set", items=(("ready", 1),)
+        ```
+        """
+        token = _SUPPRESS.set(True)
+        try:
+            yield
+        finally:
+            _SUPPRESS.reset(token)
+
+    @classmethod
+    def bulk_load(
+        cls,
+        data: Mapping[K, V] | Iterable[Tuple[K, V]],
+        on_change: Optional[Callable[[str, Sequence[Tuple[K, V]]], None]] = None,
+    ) -> "ObservableDict[K, V]":
+        """Create an ObservableDict from `data` and report it as one "bulk_load" event.
+
+        ## Args
+
+        - **data**: A mapping or an iterable of (key, value) tuples to load
+        - **on_change**: Optional change callback for the new dictionary
+
+        ## Returns
+
+        The populated `ObservableDict`
+
+        ## Note
+
+        The contents are inserted without any per-item notifications. If a
+        callback is given and `data` is not empty, it is then called once with
+        operation `"bulk_load"` and a read-only sequence of all loaded
+        `(key, value)` pairs, whose tuples are only built when it is read (like
+        `"clear"`, see the class docstring).
+
+        ## Example
+
+        ```python
+        obs_dict = ObservableDict.bulk_load({"a": 1, "b": 2}, on_change=my_callback)
+        # Triggers: operation="bulk_load", items=[("a", 1), ("b", 2)]
+        ```
+        """
+        # Construction fills the dict without notifying
+        obj = cls(data, on_change=on_change)
+        if on_change is not None and obj:
+            obj._notify(_OP_BULK_LOAD, _LazyItems(_dict_copy(obj)))
+        return obj
 
-    def _notify(self, operation: str, items: list[Tuple[K, V]]) -> None:
+    def _notify(self, operation: str, items: Sequence[Tuple[K, V]]) -> None:
         """Internal method to notify the callback of dictionary changes.
 
         ## Args
 
         - **operation**: The type of operation that was performed. Must be one of:
-            "set", "update", "pop", "popitem", "clear", "delitem", "setdefault"
-        - **items**: List of (key, value) tuples affected by the operation
+            "set", "update", "pop", "popitem", "clear", "delitem", "setdefault", "batch",
+            "bulk_load"
+        - **items**: Sequence of (key, value) tuples affected by the operation
 
         ## Note
 
         This method is called internally by mutating operations. Exceptions
-        in the callback are silently ignored to prevent disrupting dictionary
-        operations. This ensures that dictionary operations always complete
-        successfully even if the callback fails.
+        in the callback are passed to the class-wide callback error handler, if
+        one is set, and otherwise ignored. This ensures that dictionary
+        operations always complete successfully even if the callback fails.
+
+        Mutating methods check the `self._has_cb` flag themselves before
+        building the `items` sequence, so the common unobserved case never
+        allocates it or enters this method at all.
 
-        The method performs a quick check for the presence of a callback
-        before attempting to call it, optimizing performance when no callback
-        is set.
+        Inside a `suppress_notifications()` block nothing is delivered or
+        buffered. Inside a `batch()` block the items are appended to the batch
+        buffer instead of being delivered.
 
         > **Warning**: This is an internal method and should not be called directly by
         > external code. Use the public mutating methods instead.
         """
-        if self._on_change:
-            try:
-                self._on_change(operation, items)
-            except Exception:
-                pass
+        if _SUPPRESS.get():
+            return
+        batch_buffer = self._batch_buffer
+        if batch_buffer is not None:
+            batch_buffer.extend(items)
+            return
+        on_change = self._on_change
+        if on_change is None:
+            return
+        if type(on_change) is WeakMethod:
+            on_change = on_change()
+            if on_change is None:
+                # The observer was garbage collected: detach it for good
+                self.set_on_change(None)
+                return
+        try:
+            on_change(operation, items)
+        except Exception as exc:
+            # Read from the class so a plain function is not bound as a method
+            handler = type(self)._callback_error_handler
+            if handler is not None:
+                handler(exc)
 
     # Mutating operations
     def __setitem__(self, key: K, value: V) -> None:  # type: ignore[override]
@@ -198,12 +460,13 @@ class ObservableDict(Dict[K, V]):
 
         ```python
         obs_dict = ObservableDict[str, int](on_change=my_callback)
-        obs_dict["new_key"] = 42  # Triggers: operation="set", items=[("new_key", 42)]
-        obs_dict["existing_key"] = 100  # Triggers: operation="set", items=[("existing_key", 100)]
+        obs_dict["new_key"] = 42  # Triggers: operation="set", items=(("new_key", 42),)
+        obs_dict["existing_key"] = 100  # Triggers: operation="set", items=(("existing_key", 100),)
         ```
         """
-        super().__setitem__(key, value)
-        self._notify("set", [(key, value)])
+        _dict_setitem(self, key, value)
+        if self._has_cb:
+            self._notify(_OP_SET, ((key, value),))
 
     def update(self, other: Any = None, **kwargs: V) -> None:  # type: ignore[override]
         """Update the dictionary with elements from another mapping or iterable.
@@ -238,58 +501,35 @@ class ObservableDict(Dict[K, V]):
         obs_dict.update({"f": 6}, g=7)  # Triggers: operation="update", items=[("f", 6), ("g", 7)]
         ```
         """
-        changed: list[Tuple[K, V]] = []
-        if other is not None:
-            if isinstance(other, Mapping):
-                pairs_from_mapping: Iterable[Tuple[K, V]] = cast(
-                    Iterable[Tuple[K, V]], other.items()
-                )
-                changed.extend(self._assign_pairs(pairs_from_mapping))
-            else:
-                changed.extend(self._assign_pairs(other))
+        # Keyword arguments are str keys, which callers use as K (like dict(**kwargs))
+        kwarg_items = cast("Dict[K, V]", kwargs)
+        if not self._has_cb:
+            # Nothing to report: let dict.update do all the work in C
+            if other is not None:
+                _dict_update(self, other)
+            if kwargs:
+                _dict_update(self, kwarg_items)
+            return
+        if other is None:
+            # Keyword-only call such as update(status="OK")
+            if kwargs:
+                _dict_update(self, kwarg_items)
+                self._notify(_OP_UPDATE, list(kwarg_items.items()))
+            return
+        changed: list[Tuple[K, V]]
+        # Same duck typing as dict.update: anything with keys() is a mapping
+        if isinstance(other, dict):
+            changed = list(other.items())
+        elif hasattr(other, "keys"):
+            changed = [(key, other[key]) for key in other.keys()]
+        else:
+            changed = [(key, value) for key, value in other]
+        _dict_update(self, changed)
         if kwargs:
-            for k, v in kwargs.items():
-                key_as_k: K = cast(K, k)
-                super().__setitem__(key_as_k, v)
-                changed.append((key_as_k, v))
+            changed.extend(kwarg_items.items())
+            _dict_update(self, kwarg_items)
         if changed:
-            self._notify("update", changed)
-
-    # -------------------- Internal helpers --------------------
-    def _assign_pairs(self, pairs: Iterable[Tuple[K, V]]) -> list[Tuple[K, V]]:
-        """Assign key/value pairs to self and return the list of changed pairs.
-
-        This helper is separated to aid the type checker so that union types from
-        Mapping | Iterable branches don't pollute loop variable inference.
-
-        ## Args
-
-        - **pairs**: Iterable of (key, value) tuples to assign to the dictionary
-
-        ## Returns
-
-        List of (key, value) tuples that were assigned. This includes all
-        pairs that were processed, regardless of whether they replaced
-        existing values or added new ones.
-
-        ## Note
-
-        This is an internal helper method used by the `update()` method to
-        handle type checking for different input types. It performs the actual
-        assignment operations and tracks what was changed for notification purposes.
-
-        The method directly modifies the dictionary using the parent class's
-        `__setitem__` method, bypassing the observable notification system
-        to avoid duplicate notifications.
-
-        > **Warning**: This is an internal method and should not be called directly by
-        > external code. Use the public `update()` method instead.
-        """
-        changed: list[Tuple[K, V]] = []
-        for key, value in pairs:
-            super().__setitem__(key, value)
-            changed.append((key, value))
-        return changed
+            self._notify(_OP_UPDATE, changed)
 
     def setdefault(self, key: K, default: Optional[V] = None) -> V:  # type: ignore[override]
         """Set a key to a default value if the key is not already in the dictionary.
@@ -298,7 +538,7 @@ class ObservableDict(Dict[K, V]):
 
         - **key**: The key to set
         - **default**: The default value to use if the key is not present. If None,
-            the default value will be None (cast to type V)
+            the default value will be None
 
         ## Returns
 
@@ -318,24 +558,29 @@ class ObservableDict(Dict[K, V]):
         value = obs_dict.setdefault("a", 99)  # Returns 1, no notification
 
         # Key doesn't exist - triggers notification
-        value = obs_dict.setdefault("b", 42)  # Returns 42, triggers: operation="setdefault", items=[("b", 42)]
+        value = obs_dict.setdefault("b", 42)  # Returns 42, triggers: operation="setdefault", items=(("b", 42),)
         ```
         """
-        if key in self:
-            return self[key]
-        value: V = default if default is not None else cast(V, None)
-        super().__setitem__(key, value)
-        self._notify("setdefault", [(key, value)])
+        # A None default is stored as-is, so view self as holding optional values
+        store = cast("Dict[K, Optional[V]]", self)
+        if not self._has_cb:
+            return cast(V, _dict_setdefault(store, key, default))
+        # One probe: a change in length tells us whether the key was inserted
+        size = len(self)
+        value = cast(V, _dict_setdefault(store, key, default))
+        if len(self) != size:
+            self._notify(_OP_SETDEFAULT, ((key, value),))
         return value
 
-    def pop(self, key: K, default: Optional[V] = None) -> V:  # type: ignore[override]
+    def pop(self, key: K, default: V = _MISSING) -> V:  # type: ignore[override]
         """Remove and return a value from the dictionary.
 
         ## Args
 
         - **key**: The key to remove
         - **default**: Optional default value to return if the key is not found.
-            If None and key is not found, raises KeyError
+            If omitted and the key is not found, raises KeyError. An explicit
+            `None` is returned like any other default, matching `dict.pop`.
 
         ## Returns
 
@@ -357,7 +602,7 @@ class ObservableDict(Dict[K, V]):
         obs_dict = ObservableDict[str, int]({"a": 1, "b": 2}, on_change=my_callback)
 
         # Key exists - triggers notification
-        value = obs_dict.pop("a")  # Returns 1, triggers: operation="pop", items=[("a", 1)]
+        value = obs_dict.pop("a")  # Returns 1, triggers: operation="pop", items=(("a", 1),)
 
         # Key doesn't exist with default - no notification
         value = obs_dict.pop("c", 99)  # Returns 99, no notification
@@ -366,14 +611,15 @@ class ObservableDict(Dict[K, V]):
         value = obs_dict.pop("d")  # Raises KeyError
         ```
         """
-        if key in self:
-            value = super().pop(key)
-            self._notify("pop", [(key, value)])
-            return value
-        if default is not None:
+        # Single lookup: the sentinel tells a missing key apart from any stored value
+        value = _dict_pop(self, key, _MISSING)
+        if value is _MISSING:
+            if default is _MISSING:
+                raise KeyError(key)
             return default
-        # Mirror dict.pop KeyError when no default provided
-        return super().pop(key)  # type: ignore[return-value]
+        if self._has_cb:
+            self._notify(_OP_POP, ((key, value),))
+        return value
 
     def popitem(self) -> Tuple[K, V]:  # type: ignore[override]
         """Remove and return an arbitrary (key, value) pair from the dictionary.
@@ -397,12 +643,13 @@ class ObservableDict(Dict[K, V]):
         obs_dict = ObservableDict[str, int]({"a": 1, "b": 2}, on_change=my_callback)
 
         # Remove arbitrary item - triggers notification
-        key, value = obs_dict.popitem()  # Triggers: operation="popitem", items=[(key, value)]
+        key, value = obs_dict.popitem()  # Triggers: operation="popitem", items=((key, value),)
         print(f"Removed: {key} = {value}")
         ```
         """
-        item = super().popitem()
-        self._notify("popitem", [item])
+        item = _dict_popitem(self)
+        if self._has_cb:
+            self._notify(_OP_POPITEM, (item,))
         return item
 
     def clear(self) -> None:  # type: ignore[override]
@@ -425,12 +672,13 @@ class ObservableDict(Dict[K, V]):
         obs_dict.clear()  # No notification
         ```
         """
-        if not self:
-            super().clear()
+        if not self or not self._has_cb:
+            _dict_clear(self)
             return
-        removed_items = list(self.items())
-        super().clear()
-        self._notify("clear", removed_items)
+        # Bulk-clone the table; item tuples are only built if the callback reads them
+        removed_items = _LazyItems(_dict_copy(self))
+        _dict_clear(self)
+        self._notify(_OP_CLEAR, removed_items)
 
     def __delitem__(self, key: K) -> None:  # type: ignore[override]
         """Delete a key from the dictionary.
@@ -454,15 +702,18 @@ class ObservableDict(Dict[K, V]):
         obs_dict = ObservableDict[str, int]({"a": 1, "b": 2}, on_change=my_callback)
 
         # Delete existing key - triggers notification
-        del obs_dict["a"]  # Triggers: operation="delitem", items=[("a", 1)]
+        del obs_dict["a"]  # Triggers: operation="delitem", items=(("a", 1),)
 
         # Delete non-existent key - raises KeyError
         del obs_dict["c"]  # Raises KeyError
         ```
         """
+        if not self._has_cb:
+            _dict_delitem(self, key)
+            return
         value = self[key]
-        super().__delitem__(key)
-        self._notify("delitem", [(key, value)])
+        _dict_delitem(self, key)
+        self._notify(_OP_DELITEM, ((key, value),))
 
     # Convenience helpers
     def copy(self) -> "ObservableDict[K, V]":  # type: ignore[override]
@@ -493,7 +744,13 @@ class ObservableDict(Dict[K, V]):
         copy_dict["d"] = 4  # Only copy's callback is triggered
         ```
         """
-        return ObservableDict(self.items())
+        # Bypass __init__ and clone the table with dict's own merge fast path
+        new: ObservableDict[K, V] = _PlainObservableDict.__new__(_PlainObservableDict)
+        _dict_update(new, self)
+        new._on_change = None
+        new._has_cb = False
+        new._batch_buffer = None
+        return new
 
     def items(self) -> ItemsView[K, V]:  # type: ignore[override]
         """Return a view of the dictionary's key-value pairs.
@@ -568,4 +825,73 @@ class ObservableDict(Dict[K, V]):
         return dict(self)
 
 
+class _LazyItems(Sequence):
+    """Read-only `(key, value)` sequence over a private dict snapshot.
+
+    Used for notifications that can report many items. `len()` and iteration
+    read the snapshot directly; the list of tuples is only built for indexing,
+    comparison or `repr()`, so callbacks that ignore `items` pay nothing for it.
+    The snapshot is never mutated, so the contents stay valid after the call.
+    """
+
+    __slots__ = ("_source", "_items")
+
+    def __init__(self, source: Dict[Any, Any]) -> None:
+        self._source = source
+        self._items: Optional[list[Tuple[Any, Any]]] = None
+
+    def _materialize(self) -> list[Tuple[Any, Any]]:
+        items = self._items
+        if items is None:
+            items = self._items = list(_dict_items(self._source))
+        return items
+
+    def __len__(self) -> int:
+        return len(self._source)
+
+    def __iter__(self) -> Iterator[Tuple[Any, Any]]:
+        return iter(_dict_items(self._source))
+
+    def __getitem__(self, index: Any) -> Any:
+        return self._materialize()[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _LazyItems):
+            return self._materialize() == other._materialize()
+        if isinstance(other, list):
+            return self._materialize() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(self._materialize())
+
+
+class _PlainObservableDict(ObservableDict[K, V]):
+    """`ObservableDict` with no callback attached.
+
+    Mutators are `dict`'s own C implementations, so writes skip every
+    Python-level notification check. `ObservableDict` instances switch to this
+    class while unobserved and back again as soon as a callback is set.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = dict.__setitem__
+    __delitem__ = dict.__delitem__
+    update = dict.update  # type: ignore[assignment]
+    setdefault = dict.setdefault  # type: ignore[assignment]
+    pop = dict.pop  # type: ignore[assignment]
+    popitem = dict.popitem
+    clear = dict.clear
+
+    def set_on_change(
+        self, on_change: Optional[Callable[[str, Sequence[Tuple[K, V]]], None]]
+    ) -> None:
+        """Attach a callback, switching back to the observing `ObservableDict`."""
+        if on_change is not None:
+            self.__class__ = ObservableDict  # type: ignore[assignment]
+        self._on_change = _weak_callback(on_change)
+        self._has_cb = on_change is not None
+
+
 __all__ = ["ObservableDict"]
\ No newline at end of file
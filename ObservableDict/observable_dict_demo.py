@@ -1,4 +1,4 @@
-from typing import List, Tuple
+from typing import Sequence, Tuple
 
 # Yes, I'm a typing freak. But you know what's even better than type hints?
 # Dictionaries that yell at you when they change. Let's build that.
@@ -6,19 +6,34 @@ from typing import List, Tuple
 from observable_dict import ObservableDict
 
 
+# 🧭 Per-key handlers: each one gets the new value plus the whole batch of items
+def handle_status(value: str, items: Sequence[Tuple[str, str]]):
+    if value == "ERROR":
+        print(f"  -> ALERT! Task has an error: {items}")
+    print(f"  -> LOGGING: Status changed: {items}")
+
+
+def handle_progress(value: str, items: Sequence[Tuple[str, str]]):
+    print(f"  -> DASHBOARD: Updating UI with progress: {items}")
+
+
+# One dict lookup per item instead of a chain of string compares
+HANDLERS = {
+    "status": handle_status,
+    "progress": handle_progress,
+}
+
+
 # 👂 Our listener: one callback to rule them all
-def on_state_change(operation: str, items: List[Tuple[str, str]]):
+def on_state_change(operation: str, items: Sequence[Tuple[str, str]]):
     """Catches every dict change and routes it like a boss."""
     print(f"Callback triggered! Operation: '{operation}', Items: {items}")
 
     # Smart routing: different keys, different actions
     for key, value in items:
-        if key == "status" and value == "ERROR":
-            print(f"  -> ALERT! Task has an error: {items}")
-        if key == "status":
-            print(f"  -> LOGGING: Status changed: {items}")
-        if key == "progress":
-            print(f"  -> DASHBOARD: Updating UI with progress: {items}")
+        handler = HANDLERS.get(key)
+        if handler is not None:
+            handler(value, items)
 
 
 # 🚀 Let's see it in action